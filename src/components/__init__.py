@@ -1,27 +1,41 @@
 """Convenience exports for reusable UI components and helpers."""
 
 from .add_bar import AddTaskRow
+from .bulk_add import BulkAddDialog
 from .buttons import (
     add_fab,
+    add_subtask_icon_button,
+    bulk_add_icon_button,
     clear_completed_button,
     delete_icon_button,
     edit_icon_button,
+    expand_icon_button,
     save_icon_button,
 )
 from .filter_tabs import FilterTabs
 from .footer import FooterBar
 from .header import Header
+from .stats_panel import StatsPanel
+from .tag_filter import TagFilter
 from .task import Task
+from .task_pool import TaskPool
 
 __all__ = [
     "add_fab",
+    "add_subtask_icon_button",
+    "bulk_add_icon_button",
     "clear_completed_button",
     "edit_icon_button",
     "delete_icon_button",
     "save_icon_button",
+    "expand_icon_button",
     "Task",
+    "TaskPool",
     "Header",
     "AddTaskRow",
+    "BulkAddDialog",
     "FilterTabs",
     "FooterBar",
+    "StatsPanel",
+    "TagFilter",
 ]
@@ -5,7 +5,8 @@ from typing import Callable, Optional
 
 import flet as ft
 
-from .buttons import add_fab
+from ..utils import parse_tags
+from .buttons import add_fab, bulk_add_icon_button
 
 
 class AddTaskRow(ft.Column):
@@ -15,6 +16,7 @@ class AddTaskRow(ft.Column):
         self,
         on_submit: Optional[Callable[[ft.ControlEvent], None]] = None,
         on_add_click: Optional[Callable[[ft.ControlEvent], None]] = None,
+        on_bulk_add: Optional[Callable[[ft.ControlEvent], None]] = None,
     ) -> None:
         self.input: ft.TextField = ft.TextField(
             hint_text="What needs to be done?",
@@ -39,10 +41,23 @@ class AddTaskRow(ft.Column):
             width=200,
         )
 
+        self.tags_input: ft.TextField = ft.TextField(
+            label="Tags (optional)",
+            hint_text="work, home",
+            width=200,
+        )
+
         add_btn: ft.FloatingActionButton = add_fab(on_add_click or on_submit)
 
         input_row = ft.Row(
-            controls=[self.input, self.priority_dropdown, self.deadline_input, add_btn],
+            controls=[
+                self.input,
+                self.priority_dropdown,
+                self.deadline_input,
+                self.tags_input,
+                add_btn,
+                bulk_add_icon_button(on_bulk_add),
+            ],
             spacing=10,
         )
 
@@ -61,6 +76,7 @@ class AddTaskRow(ft.Column):
             "name": self.input.value,
             "priority_level": self.priority_dropdown.value,
             "deadline": deadline,
+            "tags": parse_tags(self.tags_input.value),
         }
 
     def clear_inputs(self) -> None:
@@ -68,4 +84,5 @@ class AddTaskRow(ft.Column):
         self.input.value = ""
         self.priority_dropdown.value = "low"
         self.deadline_input.value = ""
+        self.tags_input.value = ""
         self.update()
@@ -0,0 +1,90 @@
+"""Dialog for pasting a text or markdown checklist to add many tasks at once."""
+
+from typing import Callable, Optional
+
+import flet as ft
+
+
+_HELP_TEXT = (
+    "One task per line. Indent items to make subtasks; "
+    "use !high/!medium/!low, YYYY-MM-DD and #tags inline."
+)
+
+
+class BulkAddDialog(ft.AlertDialog):
+    """Modal dialog with a multi-line input and an import progress bar."""
+
+    def __init__(
+        self, on_import: Optional[Callable[[str], None]] = None
+    ) -> None:
+        self.on_import = on_import
+        self.text_input: ft.TextField = ft.TextField(
+            multiline=True,
+            min_lines=12,
+            max_lines=12,
+            hint_text=(
+                "- [ ] Write report !high 2025-12-31 #work\n"
+                "  - [ ] Collect data\n"
+                "- [ ] Buy groceries #home"
+            ),
+        )
+        self.progress: ft.ProgressBar = ft.ProgressBar(value=0, visible=False)
+        self.status: ft.Text = ft.Text(
+            _HELP_TEXT,
+            theme_style=ft.TextThemeStyle.BODY_SMALL,
+            color=ft.Colors.GREY_600,
+        )
+        self.import_btn: ft.FilledButton = ft.FilledButton(
+            "Import", on_click=self.import_clicked
+        )
+        self.cancel_btn: ft.TextButton = ft.TextButton(
+            "Cancel", on_click=self.cancel_clicked
+        )
+        super().__init__(
+            modal=True,
+            title=ft.Text("Bulk add tasks"),
+            content=ft.Column(
+                width=600,
+                tight=True,
+                spacing=10,
+                controls=[self.text_input, self.progress, self.status],
+            ),
+            actions=[self.cancel_btn, self.import_btn],
+        )
+
+    def import_clicked(self, e: ft.ControlEvent | None) -> None:
+        """Start importing the pasted text."""
+        text = self.text_input.value or ""
+        if not text.strip() or not self.on_import:
+            return
+        self.set_busy(True)
+        self.on_import(text)
+
+    def cancel_clicked(self, e: ft.ControlEvent | None) -> None:
+        """Close the dialog without importing."""
+        self.open = False
+        self.update()
+
+    def set_busy(self, busy: bool) -> None:
+        """Lock the inputs and show the progress bar while importing."""
+        self.text_input.disabled = busy
+        self.import_btn.disabled = busy
+        self.cancel_btn.disabled = busy
+        self.progress.visible = busy
+        self.progress.value = 0
+        self.update()
+
+    def set_progress(self, value: float, message: str) -> None:
+        """Update the progress bar (0..1) and status message."""
+        self.progress.value = value
+        self.status.value = message
+        self.update()
+
+    def reset(self) -> None:
+        """Clear the input and status for the next use."""
+        self.text_input.value = ""
+        self.text_input.disabled = False
+        self.import_btn.disabled = False
+        self.cancel_btn.disabled = False
+        self.progress.visible = False
+        self.status.value = _HELP_TEXT
@@ -45,3 +45,30 @@ def add_fab(on_click: Optional[Callable[[ft.ControlEvent], None]] = None) -> ft.
 def clear_completed_button(on_click: Optional[Callable[[ft.ControlEvent], None]] = None) -> ft.OutlinedButton:
     """Create the footer button for clearing completed tasks."""
     return ft.OutlinedButton(text="Clear completed", on_click=on_click)
+
+
+def add_subtask_icon_button(on_click: Optional[Callable[[ft.ControlEvent], None]] = None) -> ft.IconButton:
+    """Create the icon button for adding a subtask to a task item."""
+    return ft.IconButton(
+        icon=ft.Icons.PLAYLIST_ADD,
+        tooltip="Add subtask",
+        on_click=on_click,
+    )
+
+
+def expand_icon_button(on_click: Optional[Callable[[ft.ControlEvent], None]] = None) -> ft.IconButton:
+    """Create the icon button that expands or collapses a task's subtasks."""
+    return ft.IconButton(
+        icon=ft.Icons.CHEVRON_RIGHT,
+        tooltip="Show subtasks",
+        on_click=on_click,
+    )
+
+
+def bulk_add_icon_button(on_click: Optional[Callable[[ft.ControlEvent], None]] = None) -> ft.IconButton:
+    """Create the icon button that opens the bulk quick-add dialog."""
+    return ft.IconButton(
+        icon=ft.Icons.PLAYLIST_ADD_CHECK,
+        tooltip="Bulk add from a pasted list",
+        on_click=on_click,
+    )
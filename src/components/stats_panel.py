@@ -0,0 +1,66 @@
+"""Collapsible panel with task statistics."""
+
+import flet as ft
+
+from ..data.task_stats import TaskStatistics
+from ..utils import get_priority_emoji, get_priority_levels
+
+
+class StatsPanel(ft.ExpansionTile):
+    """Expansion tile showing per-priority, overdue and recent completion counts."""
+
+    def __init__(self, history_days: int = 7) -> None:
+        self.history_days = history_days
+        self.priority_texts: dict[str, ft.Text] = {
+            level: ft.Text(theme_style=ft.TextThemeStyle.BODY_SMALL)
+            for level in reversed(get_priority_levels())
+        }
+        self.overdue_text: ft.Text = ft.Text(
+            theme_style=ft.TextThemeStyle.BODY_SMALL, color=ft.Colors.RED_600
+        )
+        self.history_row: ft.Row = ft.Row(
+            spacing=15,
+            controls=[
+                ft.Column(
+                    spacing=2,
+                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                    controls=[
+                        ft.Text(weight=ft.FontWeight.W_500),
+                        ft.Text(theme_style=ft.TextThemeStyle.BODY_SMALL),
+                    ],
+                )
+                for _ in range(history_days)
+            ],
+        )
+
+        super().__init__(
+            title=ft.Text("Statistics", theme_style=ft.TextThemeStyle.BODY_MEDIUM),
+            expanded_cross_axis_alignment=ft.CrossAxisAlignment.START,
+            controls_padding=ft.padding.symmetric(horizontal=15, vertical=5),
+            controls=[
+                ft.Row(
+                    spacing=20,
+                    controls=[*self.priority_texts.values(), self.overdue_text],
+                ),
+                ft.Text(
+                    f"Completed in the last {history_days} days",
+                    theme_style=ft.TextThemeStyle.BODY_SMALL,
+                    color=ft.Colors.GREY_600,
+                ),
+                self.history_row,
+            ],
+        )
+
+    def set_stats(self, stats: TaskStatistics) -> None:
+        """Refresh the displayed values from the statistics counters."""
+        for level, text in self.priority_texts.items():
+            text.value = (
+                f"{get_priority_emoji(level)} {level.title()}: "
+                f"{stats.count_by_priority(level)}"
+            )
+        self.overdue_text.value = f"Overdue: {stats.overdue_count}"
+
+        history = stats.completed_history(self.history_days)
+        for column, (day, count) in zip(self.history_row.controls, history):
+            column.controls[0].value = str(count)
+            column.controls[1].value = day.strftime("%a")
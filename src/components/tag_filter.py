@@ -0,0 +1,41 @@
+"""Tag filter input used alongside the status tabs."""
+
+from typing import Callable, Optional
+
+import flet as ft
+
+from ..utils import parse_tags
+
+
+class TagFilter(ft.Row):
+    """Row with a tag query field and an all/any match selector."""
+
+    def __init__(
+        self, on_change: Optional[Callable[[ft.ControlEvent], None]] = None
+    ) -> None:
+        self.tags_input: ft.TextField = ft.TextField(
+            label="Filter by tags",
+            hint_text="work, urgent",
+            prefix_icon=ft.Icons.TAG,
+            expand=True,
+            on_change=on_change,
+        )
+        self.match_dropdown: ft.Dropdown = ft.Dropdown(
+            label="Match",
+            width=140,
+            options=[
+                ft.dropdown.Option("all", "All tags"),
+                ft.dropdown.Option("any", "Any tag"),
+            ],
+            value="all",
+            on_change=on_change,
+        )
+        super().__init__(controls=[self.tags_input, self.match_dropdown], spacing=10)
+
+    @property
+    def tags(self) -> list[str]:
+        return parse_tags(self.tags_input.value)
+
+    @property
+    def match_all(self) -> bool:
+        return self.match_dropdown.value != "any"
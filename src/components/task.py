@@ -2,17 +2,24 @@
 
 Represents a single to-do item with the ability to toggle completion,
 edit its label, priority, deadline, and delete it. The parent provides callbacks to react
-to status changes and deletions.
+to status changes and deletions. Subtasks are rendered as nested ``Task`` controls in a
+collapsible section that the parent fills in lazily on first expand.
 """
 
 from datetime import datetime
-from typing import Callable
+from typing import Callable, List
 
 import flet as ft
 
 from ..models import TaskModel
-from ..utils import get_priority_emoji
-from .buttons import delete_icon_button, edit_icon_button, save_icon_button
+from ..utils import get_priority_emoji, parse_tags
+from .buttons import (
+    add_subtask_icon_button,
+    delete_icon_button,
+    edit_icon_button,
+    expand_icon_button,
+    save_icon_button,
+)
 
 
 class Task(ft.Column):
@@ -24,6 +31,8 @@ class Task(ft.Column):
         task_status_change: Callable[["Task"], None],
         task_delete: Callable[["Task"], None],
         task_edit: Callable[["Task"], None] = None,
+        task_expand: Callable[["Task"], None] = None,
+        task_add_subtask: Callable[["Task", str], None] = None,
     ) -> None:
         super().__init__()
         self.task_model = task_model
@@ -31,8 +40,28 @@ class Task(ft.Column):
         self.task_status_change = task_status_change
         self.task_delete = task_delete
         self.task_edit = task_edit
+        self.task_expand = task_expand
+        self.task_add_subtask = task_add_subtask
 
-        # Create task info with priority and deadline
+        # Subtask state; children are only loaded on first expand
+        self.child_count = 0
+        self.expanded = False
+        self.children_loaded = False
+
+        self.tags_text = ft.Text(
+            value=self._tags_label(),
+            theme_style=ft.TextThemeStyle.BODY_SMALL,
+            color=ft.Colors.TEAL_600,
+            visible=bool(self.task_model.tags),
+        )
+
+        self.progress_text = ft.Text(
+            theme_style=ft.TextThemeStyle.BODY_SMALL,
+            color=ft.Colors.GREY_600,
+            visible=False,
+        )
+
+        # Create task info with priority, deadline, tags and subtask progress
         task_info = ft.Column(
             spacing=2,
             controls=[
@@ -60,6 +89,8 @@ class Task(ft.Column):
                         else ft.Container(),
                     ],
                 ),
+                self.tags_text,
+                self.progress_text,
             ],
         )
 
@@ -84,6 +115,14 @@ class Task(ft.Column):
             width=180,
             hint_text="YYYY-MM-DD",
         )
+        self.edit_tags = ft.TextField(
+            label="Tags",
+            width=180,
+            hint_text="work, home",
+        )
+
+        self.expand_btn = expand_icon_button(self.expand_clicked)
+        self.expand_btn.visible = False
 
         self.display_view = ft.Row(
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
@@ -91,6 +130,7 @@ class Task(ft.Column):
             controls=[
                 ft.Row(
                     controls=[
+                        self.expand_btn,
                         self.display_task,
                         task_info,
                     ],
@@ -99,6 +139,7 @@ class Task(ft.Column):
                 ft.Row(
                     spacing=0,
                     controls=[
+                        add_subtask_icon_button(self.add_subtask_clicked),
                         edit_icon_button(self.edit_clicked),
                         delete_icon_button(self.delete_clicked),
                     ],
@@ -115,6 +156,7 @@ class Task(ft.Column):
                         self.edit_name,
                         self.edit_priority,
                         self.edit_deadline,
+                        self.edit_tags,
                     ],
                     spacing=10,
                 ),
@@ -127,7 +169,23 @@ class Task(ft.Column):
                 ),
             ],
         )
-        self.controls = [self.display_view, self.edit_view]
+
+        self.subtask_input = ft.TextField(
+            hint_text="Subtask name",
+            dense=True,
+            expand=True,
+            on_submit=self.subtask_submitted,
+        )
+        self.subtask_row = ft.Row(visible=False, controls=[self.subtask_input])
+        self.children_view = ft.Column(spacing=5)
+        self.children_container = ft.Container(
+            visible=False,
+            padding=ft.padding.only(left=40),
+            content=ft.Column(
+                spacing=5, controls=[self.subtask_row, self.children_view]
+            ),
+        )
+        self.controls = [self.display_view, self.edit_view, self.children_container]
 
     def edit_clicked(self, e: ft.ControlEvent | None) -> None:
         """Switch to edit mode."""
@@ -138,6 +196,7 @@ class Task(ft.Column):
             if self.task_model.deadline
             else ""
         )
+        self.edit_tags.value = ", ".join(self.task_model.tags)
 
         self.display_view.visible = False
         self.edit_view.visible = True
@@ -160,6 +219,8 @@ class Task(ft.Column):
         else:
             self.task_model.deadline = None
 
+        self.task_model.tags = parse_tags(self.edit_tags.value)
+
         self._update_display()
         self.display_view.visible = True
         self.edit_view.visible = False
@@ -179,7 +240,7 @@ class Task(ft.Column):
     def _update_display(self) -> None:
         """Update the display view with current task data."""
         # Update the task info display
-        task_info = self.display_view.controls[0].controls[1]
+        task_info = self.display_view.controls[0].controls[2]
         task_info.controls[0].value = self.task_model.name
 
         # Update priority display
@@ -187,22 +248,112 @@ class Task(ft.Column):
             0
         ].value = f"{get_priority_emoji(self.task_model.priority_level)} {self.task_model.priority_level.title()}"
 
-        # Update deadline display
+        # Update deadline display, replacing the empty placeholder if needed
+        meta_row = task_info.controls[1]
         if self.task_model.deadline:
             deadline_text = f"📅 {self.task_model.deadline.strftime('%Y-%m-%d')}"
-            if len(task_info.controls[1].controls) > 1:
-                task_info.controls[1].controls[1].value = deadline_text
+            if len(meta_row.controls) > 1 and isinstance(meta_row.controls[1], ft.Text):
+                meta_row.controls[1].value = deadline_text
             else:
-                task_info.controls[1].controls.append(
+                meta_row.controls[1:] = [
                     ft.Text(
                         value=deadline_text,
                         theme_style=ft.TextThemeStyle.BODY_SMALL,
                         color=ft.Colors.BLUE_600,
                     )
-                )
+                ]
         else:
-            if len(task_info.controls[1].controls) > 1:
-                task_info.controls[1].controls.pop(1)
+            del meta_row.controls[1:]
+
+        # Update tags display
+        self.tags_text.value = self._tags_label()
+        self.tags_text.visible = bool(self.task_model.tags)
+
+    def _tags_label(self) -> str:
+        return " ".join(f"#{tag}" for tag in self.task_model.tags)
+
+    def bind(self, task_model: TaskModel) -> None:
+        """Rebind this control to another task model, resetting its UI state.
+
+        Used by ``TaskPool`` to recycle detached controls instead of
+        building a fresh control tree for every task.
+        """
+        self.task_model = task_model
+        self.completed = task_model.completed
+        self.display_task.value = task_model.completed
+        self.display_view.visible = True
+        self.edit_view.visible = False
+        self._update_display()
+
+        # Drop subtask state left over from the previous model
+        self.children_view.controls = []
+        self.children_loaded = False
+        self.subtask_input.value = ""
+        self.collapse()
+        self.set_child_count(0)
+        self.set_progress(0, 0)
+
+    def set_completed(self, completed: bool) -> None:
+        """Reflect a completion change made elsewhere, e.g. by a parent task."""
+        self.completed = completed
+        self.task_model.completed = completed
+        self.display_task.value = completed
+
+    def set_child_count(self, count: int) -> None:
+        """Set the number of direct subtasks, showing the expander if any."""
+        self.child_count = count
+        self.expand_btn.visible = count > 0
+
+    def set_progress(self, completed: int, total: int) -> None:
+        """Show how many of the task's descendants are completed."""
+        self.progress_text.value = f"✔ {completed}/{total} subtasks done"
+        self.progress_text.visible = total > 0
+
+    def show_children(self, children: List["Task"]) -> None:
+        """Display loaded subtask controls and expand the subtask section."""
+        self.children_view.controls = children
+        self.children_loaded = True
+        self.expanded = True
+        self.children_container.visible = True
+        self.expand_btn.icon = ft.Icons.EXPAND_MORE
+
+    def collapse(self) -> None:
+        """Hide the subtask section, keeping loaded children for later."""
+        self.expanded = False
+        self.children_container.visible = False
+        self.subtask_row.visible = False
+        self.expand_btn.icon = ft.Icons.CHEVRON_RIGHT
+
+    def expand_clicked(self, e: ft.ControlEvent | None) -> None:
+        """Toggle the subtask section, asking the parent to load it the first time."""
+        if self.expanded:
+            self.collapse()
+        else:
+            self._expand()
+        self.update()
+
+    def add_subtask_clicked(self, e: ft.ControlEvent | None) -> None:
+        """Show the subtask input, expanding the subtask section."""
+        if not self.expanded:
+            self._expand()
+        self.subtask_row.visible = True
+        self.update()
+        self.subtask_input.focus()
+
+    def _expand(self) -> None:
+        if self.children_loaded or not self.task_expand:
+            self.show_children(self.children_view.controls)
+        else:
+            self.task_expand(self)
+
+    def subtask_submitted(self, e: ft.ControlEvent | None) -> None:
+        """Create a subtask from the inline input."""
+        name = (self.subtask_input.value or "").strip()
+        if not name or not self.task_add_subtask:
+            return
+        self.subtask_input.value = ""
+        self.task_add_subtask(self, name)
+        self.subtask_input.focus()
 
     def status_changed(self, e: ft.ControlEvent | None) -> None:
         """Handle checkbox state change."""
@@ -0,0 +1,56 @@
+"""Pool of reusable task controls.
+
+Building a ``Task`` creates a dozen nested controls, so instead of dropping
+them when tasks are deleted or cleared, the app hands them back to a
+``TaskPool`` and later rebinds them to new models via ``Task.bind``.
+"""
+
+from typing import Callable, List, Optional
+
+from ..models import TaskModel
+from .task import Task
+
+
+class TaskPool:
+    """Bounded free-list of detached ``Task`` controls."""
+
+    def __init__(
+        self,
+        task_status_change: Callable[[Task], None],
+        task_delete: Callable[[Task], None],
+        task_edit: Optional[Callable[[Task], None]] = None,
+        task_expand: Optional[Callable[[Task], None]] = None,
+        task_add_subtask: Optional[Callable[[Task, str], None]] = None,
+        max_size: int = 256,
+    ) -> None:
+        self.task_status_change = task_status_change
+        self.task_delete = task_delete
+        self.task_edit = task_edit
+        self.task_expand = task_expand
+        self.task_add_subtask = task_add_subtask
+        self.max_size = max_size
+        self._free: List[Task] = []
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self, task_model: TaskModel) -> Task:
+        """Get a control bound to ``task_model``, reusing a pooled one if possible."""
+        if self._free:
+            task = self._free.pop()
+            task.bind(task_model)
+            return task
+
+        return Task(
+            task_model=task_model,
+            task_status_change=self.task_status_change,
+            task_delete=self.task_delete,
+            task_edit=self.task_edit,
+            task_expand=self.task_expand,
+            task_add_subtask=self.task_add_subtask,
+        )
+
+    def release(self, task: Task) -> None:
+        """Return a detached control to the pool, dropping it if the pool is full."""
+        if len(self._free) < self.max_size:
+            self._free.append(task)
@@ -1,4 +1,18 @@
 from .database import Database
+from .memory_repo import MemoryTaskRepository
+from .snapshot import TaskSnapshot
+from .storage import TaskStorage, create_storage
+from .tag_index import TagIndex
 from .task_repo import TaskRepository
+from .task_stats import TaskStatistics
 
-__all__ = ["Database", "TaskRepository"]
+__all__ = [
+    "Database",
+    "MemoryTaskRepository",
+    "TagIndex",
+    "TaskRepository",
+    "TaskSnapshot",
+    "TaskStatistics",
+    "TaskStorage",
+    "create_storage",
+]
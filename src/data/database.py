@@ -1,12 +1,52 @@
+import random
 import sqlite3
 import sys
+import time
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
+
+
+def _is_busy(error: sqlite3.OperationalError) -> bool:
+    """Whether an error means another connection holds a conflicting lock."""
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+def _add_column(conn: sqlite3.Connection, table: str, column: str) -> None:
+    """Add a column unless it already exists.
+
+    Only the "duplicate column" error is ignored; anything else, such as a
+    locked database while another instance migrates, is raised.
+    """
+    try:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column}")
+    except sqlite3.OperationalError as error:
+        if "duplicate column" not in str(error).lower():
+            raise
 
 
 class Database:
-    """SQlite database handler for the todo app"""
+    """SQlite database handler for the todo app
+
+    The database runs in WAL mode so readers never block the writer. Each
+    connection waits up to ``timeout`` seconds on a locked database, and
+    ``transaction()`` additionally retries taking the write lock up to
+    ``retries`` times with exponential backoff starting at ``retry_delay``.
+    """
+
+    def __init__(
+        self,
+        db_path: str = None,
+        timeout: float = 5.0,
+        retries: int = 5,
+        retry_delay: float = 0.05,
+    ):
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
 
-    def __init__(self, db_path: str = None):
         if db_path is None:
             # Determine appropriate data directory based on execution context
             if getattr(sys, "frozen", False):
@@ -27,6 +67,10 @@ class Database:
     def _init_database(self) -> None:
         """Create the database and tables if they don't exist"""
         with self.connection() as conn:
+            # WAL lets other processes read while one writes; the mode is
+            # stored in the database file, so this only has to stick once
+            conn.execute("PRAGMA journal_mode = WAL")
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS tasks (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -35,27 +79,116 @@ class Database:
                         priority_level TEXT DEFAULT 'low',
                         deadline TIMESTAMP,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        completed_at TIMESTAMP,
+                        parent_id INTEGER REFERENCES tasks(id)
                 )
             """)
 
             # Add new columns to existing table if they don't exist
-            try:
-                conn.execute(
-                    "ALTER TABLE tasks ADD COLUMN priority_level TEXT DEFAULT 'low'"
+            for column in (
+                "priority_level TEXT DEFAULT 'low'",
+                "deadline TIMESTAMP",
+                "completed_at TIMESTAMP",
+                "parent_id INTEGER REFERENCES tasks(id)",
+            ):
+                _add_column(conn, "tasks", column)
+
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_parent ON tasks (parent_id)"
+            )
+
+            # Tags live in a join table, indexed by tag for filtering
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS task_tags (
+                        task_id INTEGER NOT NULL REFERENCES tasks(id),
+                        tag TEXT NOT NULL,
+                        PRIMARY KEY (task_id, tag)
+                ) WITHOUT ROWID
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_task_tags_tag ON task_tags (tag, task_id)"
+            )
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS tasks_delete_tags
+                AFTER DELETE ON tasks
+                BEGIN
+                    DELETE FROM task_tags WHERE task_id = OLD.id;
+                END
+            """)
+
+            # Random id of this copy of the data, so a snapshot is never
+            # patched from a different or restored database file
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS task_meta (
+                        id INTEGER PRIMARY KEY CHECK (id = 1),
+                        lineage TEXT NOT NULL
                 )
-            except Exception:
-                pass  # Column already exists
+            """)
+            conn.execute(
+                "INSERT OR IGNORE INTO task_meta (id, lineage) VALUES (1, ?)",
+                (uuid.uuid4().hex,),
+            )
 
-            try:
-                conn.execute("ALTER TABLE tasks ADD COLUMN deadline TIMESTAMP")
-            except Exception:
-                pass  # Column already exists
+            # Change log of touched task ids; its sequence is the data revision
+            # that startup snapshots are stamped with
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS task_changelog (
+                        rev INTEGER PRIMARY KEY AUTOINCREMENT,
+                        task_id INTEGER NOT NULL
+                )
+            """)
+            for table, event, ref in (
+                ("tasks", "INSERT", "NEW.id"),
+                ("tasks", "UPDATE", "NEW.id"),
+                ("tasks", "DELETE", "OLD.id"),
+                ("task_tags", "INSERT", "NEW.task_id"),
+                ("task_tags", "DELETE", "OLD.task_id"),
+            ):
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_log_{event.lower()}
+                    AFTER {event} ON {table}
+                    BEGIN
+                        INSERT INTO task_changelog (task_id) VALUES ({ref});
+                    END
+                """)
 
             conn.commit()
 
     def connection(self) -> sqlite3.Connection:
         """Get a database connection"""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout)
         conn.row_factory = sqlite3.Row  # enable column access by name
+        conn.execute("PRAGMA synchronous = NORMAL")  # durable enough under WAL
         return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a write transaction, committing on success and rolling back on error.
+
+        ``BEGIN IMMEDIATE`` takes the write lock up front, so a busy database
+        is detected before any work is done and every read inside the block
+        sees the state that will be written over.
+        """
+        conn = self.connection()
+        conn.isolation_level = None  # transactions are managed explicitly below
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    break
+                except sqlite3.OperationalError as error:
+                    if not _is_busy(error) or attempt == self.retries:
+                        raise
+                    # Exponential backoff with jitter so writers don't retry in lockstep
+                    time.sleep(self.retry_delay * 2**attempt * random.uniform(1, 2))
+
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
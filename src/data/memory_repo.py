@@ -0,0 +1,231 @@
+from bisect import bisect_left, insort
+from dataclasses import replace
+from datetime import datetime
+from itertools import count
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..models.task_model import TaskModel
+from ..utils import normalize_tags, task_sort_key
+from .tag_index import TagIndex
+from .task_stats import TaskStatistics
+
+
+def _copy(task: TaskModel) -> TaskModel:
+    return replace(task, tags=list(task.tags))
+
+
+class MemoryTaskRepository:
+    """In-memory implementation of the ``TaskStorage`` protocol.
+
+    Tasks live in a dict keyed by id, alongside a sorted list of
+    ``(sort key, id)`` entries kept in display order with ``bisect`` on every
+    mutation and a parent id -> child ids map for subtasks. Nothing is
+    persisted, which makes it suitable for tests, benchmarks and throwaway
+    sessions.
+    """
+
+    def __init__(self) -> None:
+        self.stats = TaskStatistics()
+        self.tag_index = TagIndex()
+        self._tasks: Dict[int, TaskModel] = {}
+        self._order: List[Tuple[tuple, int]] = []
+        self._children: Dict[int, Set[int]] = {}
+        self._ids = count(1)
+
+    def create_task(
+        self,
+        name: str,
+        priority_level: str = "low",
+        deadline: Optional[datetime] = None,
+        tags: Optional[Iterable[str]] = None,
+        parent_id: Optional[int] = None,
+    ) -> TaskModel:
+        """Create a new task, optionally as a subtask of ``parent_id``."""
+        return self._insert(
+            TaskModel(
+                name=name,
+                priority_level=priority_level,
+                deadline=deadline,
+                tags=list(tags or []),
+                parent_id=parent_id,
+            )
+        )
+
+    def create_tasks(self, tasks: Iterable[TaskModel]) -> List[TaskModel]:
+        """Create several tasks."""
+        return [self._insert(task) for task in tasks]
+
+    def get_task(self, task_id: int) -> Optional[TaskModel]:
+        """Get a single task by id."""
+        task = self._tasks.get(task_id)
+        return _copy(task) if task else None
+
+    def get_all_tasks(self) -> List[TaskModel]:
+        """Get all tasks ordered by priority and deadline."""
+        return list(self.iter_tasks())
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[TaskModel]:
+        """Iterate over tasks in display order, optionally by completion status."""
+        for _, task_id in self._order:
+            task = self._tasks[task_id]
+            if completed is None or task.completed == completed:
+                yield _copy(task)
+
+    def count_tasks(self, completed: Optional[bool] = None) -> int:
+        """Count tasks, optionally by completion status."""
+        if completed is None:
+            return self.stats.total
+        return self.stats.completed_count if completed else self.stats.active_count
+
+    def get_children(self, parent_id: int) -> List[TaskModel]:
+        """Get the direct subtasks of a task in display order."""
+        children = [self._tasks[i] for i in self._children.get(parent_id, ())]
+        return [_copy(task) for task in sorted(children, key=task_sort_key)]
+
+    def get_subtree(self, task_id: int) -> List[TaskModel]:
+        """Get a task and all of its descendants."""
+        return [_copy(self._tasks[i]) for i in sorted(self._subtree_ids([task_id]))]
+
+    def count_children(
+        self, parent_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, int]:
+        """Number of direct subtasks per parent, for all or the given parents."""
+        if parent_ids is None:
+            parent_ids = self._children
+        return {
+            parent_id: len(self._children[parent_id])
+            for parent_id in parent_ids
+            if parent_id in self._children
+        }
+
+    def get_subtree_progress(self, task_id: int) -> Tuple[int, int]:
+        """Completed and total counts of a task's descendants."""
+        descendants = self._subtree_ids([task_id]) - {task_id}
+        completed = sum(1 for i in descendants if self._tasks[i].completed)
+        return completed, len(descendants)
+
+    def get_clearable_task_ids(self) -> Set[int]:
+        """Ids of completed top-level tasks whose subtasks are all completed too."""
+        return {
+            task.id
+            for task in self._tasks.values()
+            if task.parent_id is None
+            and task.completed
+            and all(self._tasks[i].completed for i in self._subtree_ids([task.id]))
+        }
+
+    def set_subtree_completed(self, task_id: int, completed: bool) -> List[TaskModel]:
+        """Mark a task and all its descendants (in)complete.
+
+        Returns the updated tasks.
+        """
+        for i in self._subtree_ids([task_id]):
+            if self._tasks[i].completed != completed:
+                self.update_task(i, completed=completed)
+        return self.get_subtree(task_id)
+
+    def get_task_ids_by_tags(
+        self, tags: Iterable[str], match_all: bool = True
+    ) -> Set[int]:
+        """Ids of tasks carrying all (or any) of ``tags``, from the tag index."""
+        return self.tag_index.match(normalize_tags(tags), match_all)
+
+    def get_tag_counts(self) -> Dict[str, int]:
+        """Number of tasks per tag."""
+        return self.tag_index.tag_counts()
+
+    def update_task(
+        self,
+        task_id: int,
+        name: Optional[str] = None,
+        completed: Optional[bool] = None,
+        priority_level: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> Optional[TaskModel]:
+        """Update a task"""
+        old = self._tasks.get(task_id)
+        if old is None:
+            return None
+
+        changes = {"updated_at": datetime.now()}
+        if name is not None:
+            changes["name"] = name
+        if completed is not None:
+            changes["completed"] = completed
+            # Keep the original completion time when re-saving a completed task
+            changes["completed_at"] = (
+                (old.completed_at or changes["updated_at"]) if completed else None
+            )
+        if priority_level is not None:
+            changes["priority_level"] = priority_level
+        if deadline is not None:
+            changes["deadline"] = deadline
+        if tags is not None:
+            changes["tags"] = normalize_tags(tags)
+
+        task = replace(old, **changes)
+        self._unindex(old)
+        self._index(task)
+        self.stats.replace(old, task)
+        self.tag_index.replace(task_id, old.tags, task.tags)
+        return _copy(task)
+
+    def delete_task(self, task_id: int) -> bool:
+        """Delete a task together with its subtasks"""
+        return self.delete_tasks([task_id]) > 0
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> int:
+        """Delete several tasks and their subtasks.
+
+        Returns how many tasks were removed, descendants included.
+        """
+        subtree_ids = self._subtree_ids(task_ids)
+        for task_id in subtree_ids:
+            task = self._tasks[task_id]
+            self._unindex(task)
+            self.stats.remove(task)
+            self.tag_index.remove(task_id, task.tags)
+        return len(subtree_ids)
+
+    def _subtree_ids(self, task_ids: Iterable[int]) -> Set[int]:
+        """Ids of the given existing tasks and all their descendants."""
+        found: Set[int] = set()
+        pending = [task_id for task_id in task_ids if task_id in self._tasks]
+        while pending:
+            task_id = pending.pop()
+            if task_id not in found:
+                found.add(task_id)
+                pending.extend(self._children.get(task_id, ()))
+        return found
+
+    def _insert(self, task: TaskModel) -> TaskModel:
+        now = datetime.now()
+        task = replace(
+            task,
+            id=next(self._ids),
+            created_at=now,
+            updated_at=now,
+            completed_at=now if task.completed else None,
+            tags=normalize_tags(task.tags),
+        )
+        self._index(task)
+        self.stats.add(task)
+        self.tag_index.add(task.id, task.tags)
+        return _copy(task)
+
+    def _index(self, task: TaskModel) -> None:
+        self._tasks[task.id] = task
+        insort(self._order, (task_sort_key(task), task.id))
+        if task.parent_id is not None:
+            self._children.setdefault(task.parent_id, set()).add(task.id)
+
+    def _unindex(self, task: TaskModel) -> None:
+        del self._tasks[task.id]
+        entry = (task_sort_key(task), task.id)
+        del self._order[bisect_left(self._order, entry)]
+        if task.parent_id is not None:
+            siblings = self._children[task.parent_id]
+            siblings.discard(task.id)
+            if not siblings:
+                del self._children[task.parent_id]
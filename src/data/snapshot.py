@@ -0,0 +1,147 @@
+import json
+import os
+import sqlite3
+import tempfile
+from bisect import insort
+from dataclasses import fields
+from datetime import datetime
+from operator import attrgetter
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from ..models.task_model import TaskModel
+from ..utils import task_sort_key
+from .task_repo import TaskRepository
+
+_MAGIC = "TODOSNAP"
+_FORMAT_VERSION = 2
+
+_FIELD_NAMES = tuple(field.name for field in fields(TaskModel))
+_DATETIME_INDEXES = tuple(
+    _FIELD_NAMES.index(name)
+    for name in ("deadline", "created_at", "updated_at", "completed_at")
+)
+_row_of = attrgetter(*_FIELD_NAMES)
+
+# Above this many changed tasks a full sort beats inserting them one by one
+_MAX_SPLICED_CHANGES = 1000
+
+
+class TaskSnapshot:
+    """On-disk cache of the decoded, sorted task list for fast startup.
+
+    The file is plain JSON: a header stamped with the database's lineage id
+    and change log revision, followed by the task fields as rows. On load
+    the snapshot is used as-is if both still match, or patched with just
+    the tasks changed since then; any other database, including an older
+    copy of this one, gets a full reload. Refreshing the file is left to
+    ``save()`` so it stays off the startup path.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._pending: Optional[Tuple[int, List[tuple]]] = None
+
+    def load(self, repo: TaskRepository) -> List[TaskModel]:
+        """Load all tasks, using the snapshot when possible."""
+        cached = self.read()
+        changes = repo.get_changes_since(cached[1], cached[0]) if cached else None
+
+        if changes is None:
+            tasks, revision = repo.get_all_tasks_with_revision()
+        else:
+            changed, deleted, revision = changes
+            tasks = cached[2]
+            if revision == cached[1]:
+                self._pending = None
+                return tasks
+
+            # Drop the stale tasks and splice the changed ones back in order
+            stale = deleted.union(task.id for task in changed)
+            tasks = [task for task in tasks if task.id not in stale]
+            if len(changed) > _MAX_SPLICED_CHANGES:
+                tasks.extend(changed)
+                tasks.sort(key=task_sort_key)
+            else:
+                for task in changed:
+                    insort(tasks, task, key=task_sort_key)
+
+        # Capture the rows now, before the UI starts mutating the models
+        self._pending = (revision, [_row_of(task) for task in tasks])
+        return tasks
+
+    def save(self, repo: TaskRepository) -> None:
+        """Write the snapshot if the last ``load()`` found it stale."""
+        if self._pending is None:
+            return
+        revision, rows = self._pending
+        self._pending = None
+
+        # The snapshot is only a cache, so a busy database or a failed write
+        # just leaves the next startup to do a full load
+        try:
+            # A fresh lineage tells this snapshot apart from copies of the
+            # database taken before it was written
+            lineage = repo.renew_lineage()
+            if self.write(lineage, revision, rows):
+                repo.prune_changes(revision)
+        except sqlite3.Error:
+            pass
+
+    def read(self) -> Optional[Tuple[str, int, List[TaskModel]]]:
+        """Read the snapshot, returning None if it is missing or unusable."""
+        try:
+            data = json.loads(self.path.read_bytes())
+            if data["magic"] != _MAGIC or data["version"] != _FORMAT_VERSION:
+                return None
+            # A changed TaskModel layout invalidates the snapshot
+            if tuple(data["fields"]) != _FIELD_NAMES:
+                return None
+
+            tasks = []
+            for row in data["rows"]:
+                for index in _DATETIME_INDEXES:
+                    if row[index] is not None:
+                        row[index] = datetime.fromisoformat(row[index])
+                tasks.append(TaskModel(*row))
+            return data["lineage"], data["revision"], tasks
+        except (OSError, ValueError, TypeError, KeyError, IndexError):
+            return None
+
+    def write(self, lineage: str, revision: int, rows: List[tuple]) -> bool:
+        """Atomically replace the snapshot, returning whether it was written."""
+        encoded = []
+        for row in rows:
+            row = list(row)
+            for index in _DATETIME_INDEXES:
+                if row[index] is not None:
+                    row[index] = row[index].isoformat()
+            encoded.append(row)
+        payload = {
+            "magic": _MAGIC,
+            "version": _FORMAT_VERSION,
+            "lineage": lineage,
+            "revision": revision,
+            "fields": _FIELD_NAMES,
+            "rows": encoded,
+        }
+
+        # A unique temp file so concurrent instances never share one
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                dir=self.path.parent,
+                prefix=self.path.name,
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+            ) as f:
+                tmp_path = f.name
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            return True
+        except OSError:
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
+            return False
@@ -0,0 +1,90 @@
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Set, Tuple
+
+from ..models.task_model import TaskModel
+from .database import Database
+from .memory_repo import MemoryTaskRepository
+from .task_repo import TaskRepository
+from .task_stats import TaskStatistics
+
+
+class TaskStorage(Protocol):
+    """Interface shared by the task storage backends.
+
+    Tasks are returned in display order (priority, deadline, newest first)
+    and every backend keeps ``stats`` up to date on each mutation. Deleting
+    a task also deletes its subtasks.
+    """
+
+    stats: TaskStatistics
+
+    def create_task(
+        self,
+        name: str,
+        priority_level: str = "low",
+        deadline: Optional[datetime] = None,
+        tags: Optional[Iterable[str]] = None,
+        parent_id: Optional[int] = None,
+    ) -> TaskModel: ...
+
+    def create_tasks(self, tasks: Iterable[TaskModel]) -> List[TaskModel]: ...
+
+    def get_task(self, task_id: int) -> Optional[TaskModel]: ...
+
+    def get_all_tasks(self) -> List[TaskModel]: ...
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[TaskModel]: ...
+
+    def count_tasks(self, completed: Optional[bool] = None) -> int: ...
+
+    def get_children(self, parent_id: int) -> List[TaskModel]: ...
+
+    def get_subtree(self, task_id: int) -> List[TaskModel]: ...
+
+    def count_children(
+        self, parent_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, int]: ...
+
+    def get_subtree_progress(self, task_id: int) -> Tuple[int, int]: ...
+
+    def get_clearable_task_ids(self) -> Set[int]: ...
+
+    def set_subtree_completed(
+        self, task_id: int, completed: bool
+    ) -> List[TaskModel]: ...
+
+    def get_task_ids_by_tags(
+        self, tags: Iterable[str], match_all: bool = True
+    ) -> Set[int]: ...
+
+    def get_tag_counts(self) -> Dict[str, int]: ...
+
+    def update_task(
+        self,
+        task_id: int,
+        name: Optional[str] = None,
+        completed: Optional[bool] = None,
+        priority_level: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> Optional[TaskModel]: ...
+
+    def delete_task(self, task_id: int) -> bool: ...
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> int: ...
+
+
+def create_storage(
+    backend: Optional[str] = None, db_path: Optional[str] = None
+) -> TaskStorage:
+    """Create a storage backend by name ("sqlite" or "memory").
+
+    Defaults to the ``TODO_STORAGE`` environment variable, then "sqlite".
+    """
+    backend = (backend or os.environ.get("TODO_STORAGE") or "sqlite").lower()
+    if backend == "sqlite":
+        return TaskRepository(Database(db_path))
+    if backend == "memory":
+        return MemoryTaskRepository()
+    raise ValueError(f"Unknown storage backend: {backend!r}")
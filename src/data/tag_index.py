@@ -0,0 +1,53 @@
+from typing import Dict, Iterable, Set
+
+
+class TagIndex:
+    """Inverted index from tag to the ids of the tasks carrying it.
+
+    Kept in sync by the repositories on every mutation so tag filters are
+    answered with set intersections/unions instead of scanning tasks.
+    """
+
+    def __init__(self) -> None:
+        self._task_ids: Dict[str, Set[int]] = {}
+
+    def add(self, task_id: int, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self._task_ids.setdefault(tag, set()).add(task_id)
+
+    def remove(self, task_id: int, tags: Iterable[str]) -> None:
+        for tag in tags:
+            task_ids = self._task_ids.get(tag)
+            if task_ids is None:
+                continue
+            task_ids.discard(task_id)
+            if not task_ids:
+                del self._task_ids[tag]
+
+    def replace(
+        self, task_id: int, old_tags: Iterable[str], new_tags: Iterable[str]
+    ) -> None:
+        old_tags, new_tags = set(old_tags), set(new_tags)
+        self.remove(task_id, old_tags - new_tags)
+        self.add(task_id, new_tags - old_tags)
+
+    def match(self, tags: Iterable[str], match_all: bool = True) -> Set[int]:
+        """Ids of tasks carrying all (or, with ``match_all=False``, any) of ``tags``."""
+        sets = [self._task_ids.get(tag, set()) for tag in set(tags)]
+        if not sets:
+            return set()
+        if not match_all:
+            return set().union(*sets)
+
+        # Intersect starting from the smallest set to keep the work minimal
+        sets.sort(key=len)
+        result = set(sets[0])
+        for task_ids in sets[1:]:
+            if not result:
+                break
+            result &= task_ids
+        return result
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Number of tasks per tag, sorted by tag."""
+        return {tag: len(self._task_ids[tag]) for tag in sorted(self._task_ids)}
@@ -1,54 +1,324 @@
+import json
 import sqlite3
-from datetime import datetime
-from typing import List, Optional
+import uuid
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from ..models.task_model import TaskModel
+from ..utils import normalize_tags
 from .database import Database
+from .tag_index import TagIndex
+from .task_stats import TaskStatistics
+
+# Task columns plus the task's tags, folded into one space-separated string
+_SELECT_TASKS = """
+    SELECT
+        *,
+        (SELECT group_concat(tag, ' ') FROM task_tags WHERE task_id = tasks.id) AS tags
+    FROM tasks
+"""
+
+# Ids of the seed tasks and all their descendants; the seed query goes in {seed}
+_SUBTREE = """
+    WITH RECURSIVE subtree(id) AS (
+        {seed}
+        UNION
+        SELECT tasks.id FROM tasks JOIN subtree ON tasks.parent_id = subtree.id
+    )
+"""
+
+_TASK_ORDER = """
+    ORDER BY
+        CASE priority_level
+            WHEN 'high' THEN 1
+            WHEN 'medium' THEN 2
+            WHEN 'low' THEN 3
+            ELSE 4
+        END,
+        deadline ASC NULLS LAST,
+        created_at DESC,
+        id DESC
+"""
 
 
 class TaskRepository:
-    """Repository for task data operations"""
+    """SQLite implementation of the ``TaskStorage`` protocol"""
 
     def __init__(self, database: Database):
         self.db = database
+        self.stats = TaskStatistics()
+        self.tag_index = TagIndex()
+        self._load_stats()
+        self._load_tag_index()
 
     def create_task(
         self,
         name: str,
         priority_level: str = "low",
         deadline: Optional[datetime] = None,
+        tags: Optional[Iterable[str]] = None,
+        parent_id: Optional[int] = None,
     ) -> TaskModel:
-        """Create a new task."""
-        with self.db.connection() as conn:
+        """Create a new task, optionally as a subtask of ``parent_id``."""
+        with self.db.transaction() as conn:
             cursor = conn.execute(
-                "INSERT INTO tasks (name, priority_level, deadline) VALUES (?, ?, ?)",
-                (name, priority_level, deadline.isoformat() if deadline else None),
+                "INSERT INTO tasks (name, priority_level, deadline, parent_id) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    name,
+                    priority_level,
+                    deadline.isoformat() if deadline else None,
+                    parent_id,
+                ),
             )
-            conn.commit()
+            self._insert_tags(conn, cursor.lastrowid, tags or [])
 
             # Get the created task
             row = conn.execute(
-                "SELECT * FROM tasks WHERE id = ?", (cursor.lastrowid,)
+                f"{_SELECT_TASKS} WHERE id = ?", (cursor.lastrowid,)
+            ).fetchone()
+
+        task = self._row_to_task(row)
+        self._track_added(task)
+        return task
+
+    def create_tasks(self, tasks: Iterable[TaskModel]) -> List[TaskModel]:
+        """Create several tasks in a single transaction."""
+        with self.db.transaction() as conn:
+            task_ids = []
+            for task in tasks:
+                cursor = conn.execute(
+                    "INSERT INTO tasks "
+                    "(name, priority_level, completed, completed_at, deadline, "
+                    "parent_id) "
+                    "VALUES (?, ?, ?, "
+                    "CASE WHEN ? THEN datetime('now', 'localtime') END, ?, ?)",
+                    (
+                        task.name,
+                        task.priority_level,
+                        task.completed,
+                        task.completed,
+                        task.deadline.isoformat() if task.deadline else None,
+                        task.parent_id,
+                    ),
+                )
+                self._insert_tags(conn, cursor.lastrowid, task.tags)
+                task_ids.append(cursor.lastrowid)
+
+            rows = self._rows_by_ids(conn, task_ids)
+
+        created = [self._row_to_task(row) for row in rows]
+        for task in created:
+            self._track_added(task)
+        return created
+
+    def get_task(self, task_id: int) -> Optional[TaskModel]:
+        """Get a single task by id."""
+        with self.db.connection() as conn:
+            row = conn.execute(
+                f"{_SELECT_TASKS} WHERE id = ?", (task_id,)
             ).fetchone()
-            return self._row_to_task(row)
+        return self._row_to_task(row) if row else None
 
     def get_all_tasks(self) -> List[TaskModel]:
         """Get all tasks ordered by priority and deadline."""
         with self.db.connection() as conn:
-            rows = conn.execute("""
-                SELECT * FROM tasks
-                ORDER BY
-                    CASE priority_level
-                        WHEN 'high' THEN 1
-                        WHEN 'medium' THEN 2
-                        WHEN 'low' THEN 3
-                        ELSE 4
-                    END,
-                    deadline ASC NULLS LAST,
-                    created_at DESC
-            """).fetchall()
+            rows = conn.execute(f"{_SELECT_TASKS} {_TASK_ORDER}").fetchall()
+        return [self._row_to_task(row) for row in rows]
+
+    def iter_tasks(self, completed: Optional[bool] = None) -> Iterator[TaskModel]:
+        """Iterate over tasks in display order, optionally by completion status."""
+        with self.db.connection() as conn:
+            if completed is None:
+                cursor = conn.execute(f"{_SELECT_TASKS} {_TASK_ORDER}")
+            else:
+                cursor = conn.execute(
+                    f"{_SELECT_TASKS} WHERE completed = ? {_TASK_ORDER}",
+                    (completed,),
+                )
+            for row in cursor:
+                yield self._row_to_task(row)
+
+    def count_tasks(self, completed: Optional[bool] = None) -> int:
+        """Count tasks, optionally by completion status."""
+        if completed is None:
+            return self.stats.total
+        return self.stats.completed_count if completed else self.stats.active_count
+
+    def get_children(self, parent_id: int) -> List[TaskModel]:
+        """Get the direct subtasks of a task in display order."""
+        with self.db.connection() as conn:
+            rows = conn.execute(
+                f"{_SELECT_TASKS} WHERE parent_id = ? {_TASK_ORDER}", (parent_id,)
+            ).fetchall()
         return [self._row_to_task(row) for row in rows]
 
+    def get_subtree(self, task_id: int) -> List[TaskModel]:
+        """Get a task and all of its descendants."""
+        with self.db.connection() as conn:
+            rows = self._subtree_rows(conn, task_id)
+        return [self._row_to_task(row) for row in rows]
+
+    def count_children(
+        self, parent_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, int]:
+        """Number of direct subtasks per parent, for all or the given parents."""
+        with self.db.connection() as conn:
+            if parent_ids is None:
+                rows = conn.execute(
+                    "SELECT parent_id, COUNT(*) FROM tasks "
+                    "WHERE parent_id IS NOT NULL GROUP BY parent_id"
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT parent_id, COUNT(*) FROM tasks "
+                    "WHERE parent_id IN (SELECT value FROM json_each(?)) "
+                    "GROUP BY parent_id",
+                    (json.dumps(list(parent_ids)),),
+                ).fetchall()
+        return {parent_id: count for parent_id, count in rows}
+
+    def get_subtree_progress(self, task_id: int) -> Tuple[int, int]:
+        """Completed and total counts of a task's descendants."""
+        with self.db.connection() as conn:
+            row = conn.execute(
+                _SUBTREE.format(seed="SELECT id FROM tasks WHERE parent_id = ?")
+                + "SELECT COALESCE(SUM(completed), 0), COUNT(*) FROM tasks "
+                "WHERE id IN subtree",
+                (task_id,),
+            ).fetchone()
+        return row[0], row[1]
+
+    def get_clearable_task_ids(self) -> Set[int]:
+        """Ids of completed top-level tasks whose subtasks are all completed too."""
+        with self.db.connection() as conn:
+            rows = conn.execute(
+                """
+                WITH RECURSIVE tree(root, id) AS (
+                    SELECT id, id FROM tasks WHERE parent_id IS NULL AND completed
+                    UNION ALL
+                    SELECT tree.root, tasks.id FROM tasks
+                    JOIN tree ON tasks.parent_id = tree.id
+                )
+                SELECT tree.root FROM tree JOIN tasks ON tasks.id = tree.id
+                GROUP BY tree.root
+                HAVING MIN(tasks.completed)
+                """
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def set_subtree_completed(self, task_id: int, completed: bool) -> List[TaskModel]:
+        """Mark a task and all its descendants (in)complete in one statement.
+
+        Returns the updated tasks.
+        """
+        with self.db.transaction() as conn:
+            old_rows = self._subtree_rows(conn, task_id)
+            conn.execute(
+                _SUBTREE.format(seed="SELECT ?")
+                + """
+                UPDATE tasks SET
+                    completed = ?,
+                    completed_at = CASE WHEN ?
+                        THEN COALESCE(completed_at, datetime('now', 'localtime'))
+                        ELSE NULL END,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id IN subtree AND completed != ?
+                """,
+                (task_id, completed, completed, completed),
+            )
+
+            rows = self._subtree_rows(conn, task_id)
+
+        tasks = [self._row_to_task(row) for row in rows]
+        for old_row, task in zip(old_rows, tasks):
+            self.stats.replace(self._row_to_task(old_row), task)
+        return tasks
+
+    def get_task_ids_by_tags(
+        self, tags: Iterable[str], match_all: bool = True
+    ) -> Set[int]:
+        """Ids of tasks carrying all (or any) of ``tags``, from the tag index."""
+        return self.tag_index.match(normalize_tags(tags), match_all)
+
+    def get_tag_counts(self) -> Dict[str, int]:
+        """Number of tasks per tag."""
+        return self.tag_index.tag_counts()
+
+    def get_all_tasks_with_revision(self) -> Tuple[List[TaskModel], int]:
+        """Get all tasks together with the data revision they correspond to."""
+        with self.db.connection() as conn:
+            # Read both inside one transaction so they are consistent
+            conn.execute("BEGIN")
+            rows = conn.execute(f"{_SELECT_TASKS} {_TASK_ORDER}").fetchall()
+            revision = self._revision(conn)
+            conn.commit()
+        return [self._row_to_task(row) for row in rows], revision
+
+    def get_changes_since(
+        self, revision: int, lineage: str
+    ) -> Optional[Tuple[List[TaskModel], Set[int], int]]:
+        """Get tasks changed after ``revision`` of the data with ``lineage``.
+
+        Returns the changed tasks that still exist, the ids of deleted tasks
+        and the current revision, or None if the database has another
+        lineage or the change log no longer reaches back to ``revision``.
+        """
+        with self.db.connection() as conn:
+            conn.execute("BEGIN")
+            current = self._revision(conn)
+            oldest = conn.execute("SELECT MIN(rev) FROM task_changelog").fetchone()[0]
+            if (
+                self._lineage(conn) != lineage
+                or revision > current
+                or (revision < current and (oldest is None or oldest > revision + 1))
+            ):
+                conn.commit()
+                return None
+
+            changed_ids = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT DISTINCT task_id FROM task_changelog WHERE rev > ?",
+                    (revision,),
+                )
+            }
+            rows = conn.execute(
+                f"{_SELECT_TASKS} WHERE id IN "
+                "(SELECT task_id FROM task_changelog WHERE rev > ?)",
+                (revision,),
+            ).fetchall()
+            conn.commit()
+
+        changed = [self._row_to_task(row) for row in rows]
+        deleted = changed_ids.difference(task.id for task in changed)
+        return changed, deleted, current
+
+    def renew_lineage(self) -> str:
+        """Give the data a new random lineage id and return it.
+
+        Copies of the database made before this call keep the old id.
+        """
+        lineage = uuid.uuid4().hex
+        with self.db.transaction() as conn:
+            conn.execute("UPDATE task_meta SET lineage = ? WHERE id = 1", (lineage,))
+        return lineage
+
+    def prune_changes(self, revision: int) -> None:
+        """Drop change log entries up to and including ``revision``."""
+        with self.db.transaction() as conn:
+            conn.execute("DELETE FROM task_changelog WHERE rev <= ?", (revision,))
+
+    def _lineage(self, conn: sqlite3.Connection) -> Optional[str]:
+        row = conn.execute("SELECT lineage FROM task_meta WHERE id = 1").fetchone()
+        return row[0] if row else None
+
+    def _revision(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'task_changelog'"
+        ).fetchone()
+        return row[0] if row else 0
+
     def update_task(
         self,
         task_id: int,
@@ -56,6 +326,7 @@ class TaskRepository:
         completed: Optional[bool] = None,
         priority_level: Optional[str] = None,
         deadline: Optional[datetime] = None,
+        tags: Optional[Iterable[str]] = None,
     ) -> Optional[TaskModel]:
         """Update a task"""
         updates = []
@@ -68,6 +339,13 @@ class TaskRepository:
         if completed is not None:
             updates.append("completed = ? ")
             params.append(completed)
+            # Keep the original completion time when re-saving a completed task
+            updates.append(
+                "completed_at = CASE WHEN ? "
+                "THEN COALESCE(completed_at, datetime('now', 'localtime')) "
+                "ELSE NULL END "
+            )
+            params.append(completed)
 
         if priority_level is not None:
             updates.append("priority_level = ? ")
@@ -80,23 +358,124 @@ class TaskRepository:
         updates.append("updated_at = CURRENT_TIMESTAMP")
         params.append(task_id)
 
-        with self.db.connection() as conn:
+        with self.db.transaction() as conn:
+            old_row = conn.execute(
+                f"{_SELECT_TASKS} WHERE id = ?", (task_id,)
+            ).fetchone()
+            if old_row is None:
+                return None
+
             conn.execute(f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?", params)
-            conn.commit()
+            if tags is not None:
+                conn.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
+                self._insert_tags(conn, task_id, tags)
 
             # Get the updated task
             row = conn.execute(
-                "SELECT * FROM tasks WHERE id = ?", (task_id,)
+                f"{_SELECT_TASKS} WHERE id = ?", (task_id,)
             ).fetchone()
 
-            return self._row_to_task(row) if row else None
+        old_task, task = self._row_to_task(old_row), self._row_to_task(row)
+        self.stats.replace(old_task, task)
+        self.tag_index.replace(task_id, old_task.tags, task.tags)
+        return task
 
     def delete_task(self, task_id: int) -> bool:
-        """Delete a task"""
+        """Delete a task together with its subtasks"""
+        return self.delete_tasks([task_id]) > 0
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> int:
+        """Delete several tasks and their subtasks in one statement.
+
+        Returns how many tasks were removed, descendants included.
+        """
+        ids_json = json.dumps(list(task_ids))
+        seed = "SELECT value FROM json_each(?)"
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                _SUBTREE.format(seed=seed)
+                + f"{_SELECT_TASKS} WHERE id IN subtree",
+                (ids_json,),
+            ).fetchall()
+            conn.execute(
+                _SUBTREE.format(seed=seed) + "DELETE FROM tasks WHERE id IN subtree",
+                (ids_json,),
+            )
+
+        for row in rows:
+            self._track_removed(self._row_to_task(row))
+        return len(rows)
+
+    def _subtree_rows(
+        self, conn: sqlite3.Connection, task_id: int
+    ) -> List[sqlite3.Row]:
+        """Fetch the rows of a task and its descendants, in id order."""
+        return conn.execute(
+            _SUBTREE.format(seed="SELECT ?")
+            + f"{_SELECT_TASKS} WHERE id IN subtree ORDER BY id",
+            (task_id,),
+        ).fetchall()
+
+    def _insert_tags(
+        self, conn: sqlite3.Connection, task_id: int, tags: Iterable[str]
+    ) -> None:
+        conn.executemany(
+            "INSERT INTO task_tags (task_id, tag) VALUES (?, ?)",
+            ((task_id, tag) for tag in normalize_tags(tags)),
+        )
+
+    def _track_added(self, task: TaskModel) -> None:
+        """Apply a created task to the in-memory statistics and tag index."""
+        self.stats.add(task)
+        self.tag_index.add(task.id, task.tags)
+
+    def _track_removed(self, task: TaskModel) -> None:
+        """Apply a deleted task to the in-memory statistics and tag index."""
+        self.stats.remove(task)
+        self.tag_index.remove(task.id, task.tags)
+
+    def _rows_by_ids(
+        self, conn: sqlite3.Connection, task_ids: List[int]
+    ) -> List[sqlite3.Row]:
+        """Fetch the rows for a list of ids, in id order."""
+        # Passing the ids as one JSON array avoids SQLite's bound-parameter limit
+        return conn.execute(
+            f"{_SELECT_TASKS} WHERE id IN (SELECT value FROM json_each(?)) "
+            "ORDER BY id",
+            (json.dumps(task_ids),),
+        ).fetchall()
+
+    def _load_stats(self) -> None:
+        """Seed the statistics counters from aggregate queries."""
         with self.db.connection() as conn:
-            cursor = conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-            conn.commit()
-            return cursor.rowcount > 0
+            status_rows = conn.execute("""
+                SELECT COALESCE(NULLIF(priority_level, ''), 'low'), completed, COUNT(*)
+                FROM tasks
+                GROUP BY 1, 2
+            """).fetchall()
+            deadline_rows = conn.execute("""
+                SELECT date(deadline), COUNT(*) FROM tasks
+                WHERE NOT completed AND deadline IS NOT NULL
+                GROUP BY 1
+            """).fetchall()
+            completed_rows = conn.execute("""
+                SELECT date(completed_at), COUNT(*) FROM tasks
+                WHERE completed AND completed_at IS NOT NULL
+                GROUP BY 1
+            """).fetchall()
+
+        self.stats.seed(
+            ((level, bool(completed), count) for level, completed, count in status_rows),
+            ((date.fromisoformat(day), count) for day, count in deadline_rows if day),
+            ((date.fromisoformat(day), count) for day, count in completed_rows if day),
+        )
+
+    def _load_tag_index(self) -> None:
+        """Build the tag index from the join table."""
+        with self.db.connection() as conn:
+            rows = conn.execute("SELECT tag, task_id FROM task_tags ORDER BY tag")
+            for tag, task_id in rows:
+                self.tag_index.add(task_id, (tag,))
 
     def _row_to_task(self, row: sqlite3.Row) -> TaskModel:
         """Convert a database row to a TaskModel."""
@@ -112,6 +491,14 @@ class TaskRepository:
         if "priority_level" in row.keys() and row["priority_level"]:
             priority_level = row["priority_level"]
 
+        completed_at = None
+        if "completed_at" in row.keys() and row["completed_at"]:
+            completed_at = datetime.fromisoformat(row["completed_at"])
+
+        tags = []
+        if "tags" in row.keys() and row["tags"]:
+            tags = sorted(row["tags"].split())
+
         return TaskModel(
             id=row["id"],
             name=row["name"],
@@ -120,4 +507,7 @@ class TaskRepository:
             deadline=deadline,
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
+            completed_at=completed_at,
+            tags=tags,
+            parent_id=row["parent_id"] if "parent_id" in row.keys() else None,
         )
@@ -0,0 +1,109 @@
+from collections import Counter
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from ..models.task_model import TaskModel
+
+
+def _bump(counter: Counter, key, delta: int) -> None:
+    """Adjust a counter entry, dropping it once it reaches zero."""
+    value = counter[key] + delta
+    if value > 0:
+        counter[key] = value
+    else:
+        counter.pop(key, None)
+
+
+class TaskStatistics:
+    """Aggregate task counters maintained incrementally.
+
+    The repository seeds the counters once from aggregate queries and then
+    applies a delta for every task it creates, updates or deletes, so reading
+    any statistic never iterates over the tasks themselves.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self.total = 0
+        self.completed_count = 0
+        self._by_priority: Counter = Counter()
+        self._completed_per_day: Counter = Counter()
+
+        # Active tasks per deadline day, used to (re)compute the overdue count
+        self._active_deadlines: Counter = Counter()
+        self._overdue_day: Optional[date] = None
+        self._overdue = 0
+
+    @property
+    def active_count(self) -> int:
+        return self.total - self.completed_count
+
+    @property
+    def overdue_count(self) -> int:
+        """Number of active tasks whose deadline is before today."""
+        today = date.today()
+        if today != self._overdue_day:
+            # Only recomputed when the day rolls over
+            self._overdue = sum(
+                count for day, count in self._active_deadlines.items() if day < today
+            )
+            self._overdue_day = today
+        return self._overdue
+
+    def count_by_priority(self, priority_level: str) -> int:
+        return self._by_priority[priority_level]
+
+    def completed_on(self, day: date) -> int:
+        return self._completed_per_day[day]
+
+    def completed_history(self, days: int = 7) -> List[Tuple[date, int]]:
+        """Completed task counts for the last ``days`` days, oldest first."""
+        today = date.today()
+        return [
+            (day, self._completed_per_day[day])
+            for day in (today - timedelta(days=offset) for offset in range(days - 1, -1, -1))
+        ]
+
+    def seed(
+        self,
+        status_counts: Iterable[Tuple[str, bool, int]],
+        active_deadline_counts: Iterable[Tuple[date, int]],
+        completed_day_counts: Iterable[Tuple[date, int]],
+    ) -> None:
+        """Reset the counters from pre-aggregated (key, count) rows."""
+        self._reset()
+        for priority_level, completed, count in status_counts:
+            self.total += count
+            if completed:
+                self.completed_count += count
+            _bump(self._by_priority, priority_level, count)
+        for day, count in active_deadline_counts:
+            _bump(self._active_deadlines, day, count)
+        for day, count in completed_day_counts:
+            _bump(self._completed_per_day, day, count)
+
+    def add(self, task: TaskModel) -> None:
+        self._apply(task, 1)
+
+    def remove(self, task: TaskModel) -> None:
+        self._apply(task, -1)
+
+    def replace(self, old: TaskModel, new: TaskModel) -> None:
+        self._apply(old, -1)
+        self._apply(new, 1)
+
+    def _apply(self, task: TaskModel, delta: int) -> None:
+        self.total += delta
+        _bump(self._by_priority, task.priority_level, delta)
+
+        if task.completed:
+            self.completed_count += delta
+            if task.completed_at:
+                _bump(self._completed_per_day, task.completed_at.date(), delta)
+        elif task.deadline:
+            day = task.deadline.date()
+            _bump(self._active_deadlines, day, delta)
+            if self._overdue_day is not None and day < self._overdue_day:
+                self._overdue += delta
@@ -1,5 +1,7 @@
 """Application entrypoint for Flet runtime."""
 
+import multiprocessing
+
 import flet as ft
 
 from src.todo import TodoApp
@@ -23,4 +25,6 @@ def main(page: ft.Page) -> None:
 
 
 if __name__ == "__main__":
+    # Needed for the bulk-add worker processes in PyInstaller builds
+    multiprocessing.freeze_support()
     ft.app(main)
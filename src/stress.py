@@ -0,0 +1,168 @@
+"""Multi-process stress test for the SQLite task storage.
+
+Starts several processes that each open their own ``TaskRepository`` on a
+shared database file and hammer it with writes: every iteration creates a
+task, completes it, and increments a shared counter with a read-modify-write
+inside ``Database.transaction()``. Afterwards it checks that every process
+succeeded, that no update was lost and, with ``--min-throughput``, that the
+writes per second reached the given floor.
+
+Run from the project root::
+
+    uv run python -m src.stress --processes 8 --iterations 100 --min-throughput 500
+
+Exits with status 1 if any check fails.
+"""
+
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from .data import Database, TaskRepository
+
+# Write transactions per iteration: create, complete, counter increment
+WRITES_PER_ITERATION = 3
+
+
+def _open_database(db_path: str, timeout: float, retries: int) -> Database:
+    return Database(db_path, timeout=timeout, retries=retries)
+
+
+def _create_counter(db: Database) -> None:
+    with db.transaction() as conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS stress_counter "
+            "(id INTEGER PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+        conn.execute("INSERT OR REPLACE INTO stress_counter (id, value) VALUES (1, 0)")
+
+
+def _read_counter(db: Database) -> int:
+    with db.connection() as conn:
+        row = conn.execute("SELECT value FROM stress_counter WHERE id = 1").fetchone()
+    return row[0]
+
+
+def _worker(
+    worker_id: int, db_path: str, iterations: int, timeout: float, retries: int
+) -> None:
+    """Create and complete tasks and bump the shared counter ``iterations`` times."""
+    task_repo = TaskRepository(_open_database(db_path, timeout, retries))
+    for i in range(iterations):
+        task = task_repo.create_task(f"stress {worker_id}-{i}")
+        task_repo.update_task(task.id, completed=True)
+
+        # Deliberately read then write in Python: only the write lock taken
+        # by BEGIN IMMEDIATE keeps concurrent increments from being lost
+        with task_repo.db.transaction() as conn:
+            value = conn.execute(
+                "SELECT value FROM stress_counter WHERE id = 1"
+            ).fetchone()[0]
+            conn.execute(
+                "UPDATE stress_counter SET value = ? WHERE id = 1", (value + 1,)
+            )
+
+
+def run_stress(
+    db_path: str,
+    processes: int = 8,
+    iterations: int = 100,
+    timeout: float = 10.0,
+    retries: int = 10,
+    min_throughput: float = 0.0,
+) -> List[str]:
+    """Run the stress test against ``db_path`` and return any failures."""
+    db = _open_database(db_path, timeout, retries)
+    _create_counter(db)
+    before = TaskRepository(db)
+
+    # Spawn so each worker opens its own connections from scratch
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(
+            target=_worker, args=(worker_id, db_path, iterations, timeout, retries)
+        )
+        for worker_id in range(processes)
+    ]
+
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    expected = processes * iterations
+    failures = [
+        f"process {worker_id} exited with {worker.exitcode}"
+        for worker_id, worker in enumerate(workers)
+        if worker.exitcode != 0
+    ]
+
+    # A fresh repository reloads its counters from what the workers wrote
+    after = TaskRepository(db)
+    total = after.count_tasks() - before.count_tasks()
+    completed = after.count_tasks(completed=True) - before.count_tasks(completed=True)
+    counter = _read_counter(db)
+    if total != expected:
+        failures.append(f"expected {expected} tasks, found {total}")
+    if completed != expected:
+        failures.append(f"expected {expected} completed tasks, found {completed}")
+    if counter != expected:
+        failures.append(f"expected counter {expected}, found {counter}")
+
+    writes = expected * WRITES_PER_ITERATION
+    throughput = writes / elapsed
+    if throughput < min_throughput:
+        failures.append(
+            f"throughput {throughput:.0f} writes/s is below {min_throughput:.0f}"
+        )
+    print(
+        f"{processes} processes x {iterations} iterations: "
+        f"{writes} writes in {elapsed:.2f}s ({throughput:.0f} writes/s)"
+    )
+    print(f"new tasks: {total}, completed: {completed}, counter: {counter}")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--retries", type=int, default=10)
+    parser.add_argument(
+        "--min-throughput",
+        type=float,
+        default=0.0,
+        help="Fail if fewer writes per second than this are reached",
+    )
+    parser.add_argument(
+        "--db", help="Scratch database file to use; defaults to a temporary one"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = args.db or str(Path(tmp_dir) / "stress.db")
+        failures = run_stress(
+            db_path,
+            args.processes,
+            args.iterations,
+            args.timeout,
+            args.retries,
+            args.min_throughput,
+        )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK: no lost updates")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,68 @@
 """Todo application root control composed of reusable components."""
 
-from typing import Dict
+from typing import Dict, Optional
 
 import flet as ft
 
-from .components import AddTaskRow, FilterTabs, FooterBar, Header, Task
-from .data import Database, TaskRepository
+from .bulk_parser import import_parsed, parse_checklist
+from .components import (
+    AddTaskRow,
+    BulkAddDialog,
+    FilterTabs,
+    FooterBar,
+    Header,
+    StatsPanel,
+    TagFilter,
+    Task,
+    TaskPool,
+)
+from .data import TaskRepository, TaskSnapshot, TaskStorage, create_storage
+from .models import TaskModel
 
 
 class TodoApp(ft.Column):
     """Main todo application component."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, task_repo: Optional[TaskStorage] = None, use_snapshot: bool = True
+    ) -> None:
         super().__init__()
 
-        # Initialize database and repository
-        self.db = Database()
-        self.task_repo = TaskRepository(self.db)
+        # Initialize storage, defaulting to the configured backend
+        self.task_repo = task_repo if task_repo is not None else create_storage()
 
-        # Load existing tasks
+        # Optional startup cache of the decoded task list (SQLite only)
+        self.snapshot = (
+            TaskSnapshot(self.task_repo.db.db_path.with_suffix(".snapshot"))
+            if use_snapshot and isinstance(self.task_repo, TaskRepository)
+            else None
+        )
+
+        # Recycles Task controls of deleted tasks for new ones
+        self.task_pool = TaskPool(
+            task_status_change=self.task_status_change,
+            task_delete=self.task_delete,
+            task_edit=self.task_edit,
+            task_expand=self.task_expand,
+            task_add_subtask=self.task_add_subtask,
+        )
+
+        # Load existing top-level tasks; subtask controls load on expand
         self.tasks: Dict[int, Task] = {}
+        self.subtasks: Dict[int, Task] = {}
         self._load_tasks()
 
         # UI Components
-        self.new_task = AddTaskRow(on_submit=self.add_clicked)
+        self.new_task = AddTaskRow(
+            on_submit=self.add_clicked, on_bulk_add=self.bulk_add_clicked
+        )
+        self.bulk_add_dialog = BulkAddDialog(on_import=self.bulk_import)
         self.tasks_views = ft.Column()
         self.filter_tabs = FilterTabs(on_change=self.tabs_changed)
+        self.tag_filter = TagFilter(on_change=self.tabs_changed)
         self.footer = FooterBar(on_clear=self.clear_completed_tasks)
         self.items_left = self.footer.items_left
+        self.stats_panel = StatsPanel()
 
         # Update tasks view
         self._update_tasks_view()
@@ -41,25 +76,64 @@ class TodoApp(ft.Column):
                 spacing=25,
                 controls=[
                     self.filter_tabs,
+                    self.tag_filter,
                     self.tasks_views,
                     self.footer,
+                    self.stats_panel,
                 ],
             ),
         ]
 
+    def did_mount(self) -> None:
+        # Refresh a stale snapshot in the background once the UI is showing
+        if self.snapshot:
+            self.page.run_thread(self.snapshot.save, self.task_repo)
+
     def _load_tasks(self) -> None:
-        """Load tasks from database."""
-        task_models = self.task_repo.get_all_tasks()
+        """Load tasks from the snapshot cache or database."""
+        if self.snapshot:
+            task_models = self.snapshot.load(self.task_repo)
+        else:
+            task_models = self.task_repo.get_all_tasks()
+
+        for task in self.tasks.values():
+            self._release_tree(task)
+        self.subtasks = {}
+
+        child_counts = self.task_repo.count_children()
         self.tasks = {
-            model.id: Task(
-                task_model=model,
-                task_status_change=self.task_status_change,
-                task_delete=self.task_delete,
-                task_edit=self.task_edit,
-            )
+            model.id: self._acquire(model, child_counts)
             for model in task_models
+            if model.parent_id is None
         }
 
+    def _acquire(self, model: TaskModel, child_counts: Dict[int, int]) -> Task:
+        """Get a pooled control for ``model`` with its subtask count set."""
+        task = self.task_pool.acquire(model)
+        task.set_child_count(child_counts.get(model.id, 0))
+        return task
+
+    def _release_tree(self, task: Task) -> None:
+        """Recycle a detached control and any loaded subtask controls under it."""
+        for child in task.children_view.controls:
+            self.subtasks.pop(child.task_model.id, None)
+            self._release_tree(child)
+        self.task_pool.release(task)
+
+    def _find_task(self, task_id: Optional[int]) -> Optional[Task]:
+        """Find a loaded top-level or subtask control by task id."""
+        task = self.tasks.get(task_id)
+        return task if task is not None else self.subtasks.get(task_id)
+
+    def _refresh_progress(self, task: Optional[Task]) -> None:
+        """Refresh subtask progress of ``task`` and its loaded ancestors."""
+        while task is not None:
+            if task.children_loaded:
+                task.set_progress(
+                    *self.task_repo.get_subtree_progress(task.task_model.id)
+                )
+            task = self._find_task(task.task_model.parent_id)
+
     def add_clicked(self, e: ft.ControlEvent | None) -> None:
         """Handle adding a new task"""
         task_data = self.new_task.get_task_data()
@@ -72,15 +146,11 @@ class TodoApp(ft.Column):
             name=task_name,
             priority_level=task_data["priority_level"],
             deadline=task_data["deadline"],
+            tags=task_data["tags"],
         )
 
-        # Create UI Component
-        task_component = Task(
-            task_model=task_model,
-            task_status_change=self.task_status_change,
-            task_delete=self.task_delete,
-            task_edit=self.task_edit,
-        )
+        # Create UI Component, reusing a pooled control when available
+        task_component = self._acquire(task_model, {})
 
         # Add to tasks dict
         self.tasks[task_model.id] = task_component
@@ -91,10 +161,52 @@ class TodoApp(ft.Column):
         self.new_task.input.focus()
         self.update()
 
+    def bulk_add_clicked(self, e: ft.ControlEvent | None) -> None:
+        """Open the bulk quick-add dialog."""
+        self.bulk_add_dialog.reset()
+        self.page.open(self.bulk_add_dialog)
+
+    def bulk_import(self, text: str) -> None:
+        """Import a pasted checklist without blocking the UI thread."""
+        self.page.run_thread(self._run_bulk_import, text)
+
+    def _run_bulk_import(self, text: str) -> None:
+        """Parse pasted text (on a process pool if large) and batch-insert it."""
+        dialog = self.bulk_add_dialog
+        try:
+            parsed = parse_checklist(
+                text,
+                on_progress=lambda done: dialog.set_progress(0.8 * done, "Parsing..."),
+            )
+            dialog.set_progress(0.8, f"Adding {len(parsed)} tasks...")
+            created = import_parsed(self.task_repo, parsed)
+        except Exception as ex:
+            dialog.set_busy(False)
+            dialog.set_progress(0, f"Import failed: {ex}")
+            return
+
+        # Only top-level tasks get controls now; subtasks load on expand
+        roots = [model for model in created if model.parent_id is None]
+        child_counts = self.task_repo.count_children(model.id for model in roots)
+        for model in roots:
+            self.tasks[model.id] = self._acquire(model, child_counts)
+
+        self.page.close(dialog)
+        self._update_tasks_view()
+        self.update()
+
     def task_status_change(self, task: Task) -> None:
         """Handle task status change."""
-        # Update in database
-        self.task_repo.update_task(task.task_model.id, completed=task.completed)
+        # Update in database; completing a parent completes its whole subtree
+        if task.completed and task.child_count:
+            for model in self.task_repo.set_subtree_completed(task.task_model.id, True):
+                loaded = self._find_task(model.id)
+                if loaded is not None:
+                    loaded.set_completed(model.completed)
+        else:
+            self.task_repo.update_task(task.task_model.id, completed=task.completed)
+
+        self._refresh_progress(task)
         self._update_tasks_view()
         self.update()
 
@@ -106,38 +218,85 @@ class TodoApp(ft.Column):
             name=task.task_model.name,
             priority_level=task.task_model.priority_level,
             deadline=task.task_model.deadline,
+            tags=task.task_model.tags,
         )
         self._update_tasks_view()
         self.update()
 
     def task_delete(self, task: Task) -> None:
         """Handle task deletion."""
-        # Delete from database
+        # Delete from database, subtasks included
         self.task_repo.delete_task(task.task_model.id)
 
-        # Remove from tasks dictionary
-        del self.tasks[task.task_model.id]
+        # Detach from its parent or the top-level list and recycle the controls
+        parent = self._find_task(task.task_model.parent_id)
+        if parent is not None:
+            del self.subtasks[task.task_model.id]
+            parent.children_view.controls.remove(task)
+            parent.set_child_count(parent.child_count - 1)
+            self._refresh_progress(parent)
+        else:
+            del self.tasks[task.task_model.id]
+        self._release_tree(task)
 
         self._update_tasks_view()
         self.update()
 
     def clear_completed_tasks(self, e: ft.ControlEvent | None) -> None:
-        """Remove all completed tasks from the list and storage."""
+        """Remove completed tasks from the list and storage.
+
+        A top-level task is only cleared once all of its subtasks are completed
+        as well, so active subtasks are never deleted along with their parent.
+        """
         completed_task_ids = [
-            task_id for task_id, task in self.tasks.items() if task.completed
+            task_id
+            for task_id in self.task_repo.get_clearable_task_ids()
+            if task_id in self.tasks
         ]
         if not completed_task_ids:
             return
 
+        # One set-based delete removes the tasks together with their subtasks
+        self.task_repo.delete_tasks(completed_task_ids)
         for task_id in completed_task_ids:
-            self.task_repo.delete_task(task_id)
-            del self.tasks[task_id]
+            self._release_tree(self.tasks.pop(task_id))
 
         self._update_tasks_view()
         self.update()
 
+    def task_expand(self, task: Task) -> None:
+        """Load and show the subtasks of a task the first time it is expanded."""
+        models = self.task_repo.get_children(task.task_model.id)
+        child_counts = self.task_repo.count_children(model.id for model in models)
+        children = [self._acquire(model, child_counts) for model in models]
+        for child in children:
+            self.subtasks[child.task_model.id] = child
+
+        task.show_children(children)
+        task.set_progress(*self.task_repo.get_subtree_progress(task.task_model.id))
+
+    def task_add_subtask(self, task: Task, name: str) -> None:
+        """Create a subtask under ``task``."""
+        model = self.task_repo.create_task(
+            name=name,
+            priority_level=task.task_model.priority_level,
+            parent_id=task.task_model.id,
+        )
+
+        if task.children_loaded:
+            child = self._acquire(model, {})
+            self.subtasks[model.id] = child
+            task.children_view.controls.append(child)
+        else:
+            self.task_expand(task)
+        task.set_child_count(task.child_count + 1)
+
+        self._refresh_progress(task)
+        self._update_tasks_view()
+        self.update()
+
     def tabs_changed(self, e: ft.ControlEvent) -> None:
-        """Handle filter tab change."""
+        """Handle filter tab or tag filter change."""
         self._update_tasks_view()
         self.update()
 
@@ -153,6 +312,17 @@ class TodoApp(ft.Column):
             status = "all"
 
         all_tasks = list(self.tasks.values())
+
+        # Narrow down by tags first using the repository's inverted index
+        tags = self.tag_filter.tags
+        if tags:
+            tagged_ids = self.task_repo.get_task_ids_by_tags(
+                tags, match_all=self.tag_filter.match_all
+            )
+            all_tasks = [
+                task for task_id, task in self.tasks.items() if task_id in tagged_ids
+            ]
+
         if status == "active":
             filtered_tasks = [task for task in all_tasks if not task.completed]
         elif status == "completed":
@@ -163,9 +333,15 @@ class TodoApp(ft.Column):
         # Update tasks view
         self.tasks_views.controls = filtered_tasks
 
-        # Update footer state
-        active_count = sum(1 for task in self.tasks.values() if not task.completed)
-        self.footer.set_count(active_count)
-
-        completed_count = sum(1 for task in self.tasks.values() if task.completed)
-        self.footer.set_clear_visible(status == "completed" and completed_count > 0)
+        # Update footer and statistics from the repository's running counters
+        stats = self.task_repo.stats
+        self.footer.set_count(stats.active_count)
+        self.footer.set_summary(stats.completed_count, stats.overdue_count)
+        # Offer clearing when a top-level task is completed; whether its
+        # subtasks allow it is only worked out when the button is clicked
+        self.footer.set_clear_visible(
+            status == "completed"
+            and stats.completed_count > 0
+            and any(task.completed for task in self.tasks.values())
+        )
+        self.stats_panel.set_stats(stats)
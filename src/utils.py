@@ -1,5 +1,9 @@
 """Utility functions for the todo app."""
 
+import re
+from datetime import datetime
+from typing import Iterable
+
 
 def get_priority_emoji(priority_level: str) -> str:
     """Get the fire emoji representation for priority level."""
@@ -10,3 +14,36 @@ def get_priority_emoji(priority_level: str) -> str:
 def get_priority_levels() -> list[str]:
     """Get list of available priority levels."""
     return ["low", "medium", "high"]
+
+
+def get_priority_rank(priority_level: str) -> int:
+    """Get the sort rank of a priority level (high first)."""
+    priority_ranks = {"high": 1, "medium": 2, "low": 3}
+    return priority_ranks.get(priority_level, 4)
+
+
+def task_sort_key(task) -> tuple:
+    """Sort key matching the repository order: priority, deadline, newest first."""
+    return (
+        get_priority_rank(task.priority_level),
+        task.deadline is None,
+        task.deadline or datetime.min,
+        -task.created_at.timestamp() if task.created_at else 0.0,
+        -(task.id or 0),
+    )
+
+
+def normalize_tags(tags: Iterable[str]) -> list[str]:
+    """Lowercase tags, strip leading '#', and return them sorted without duplicates.
+
+    Whitespace inside a tag is collapsed to '-', so "two words" becomes
+    "two-words" and a tag never contains the separator used to store tag lists.
+    """
+    return sorted(
+        {"-".join(tag.strip().lstrip("#").lower().split()) for tag in tags} - {""}
+    )
+
+
+def parse_tags(text: str) -> list[str]:
+    """Parse a comma or space separated tag string such as "#work, home"."""
+    return normalize_tags(re.split(r"[,\s]+", text or ""))